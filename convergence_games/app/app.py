@@ -14,6 +14,7 @@ from .app_config import (
     openapi_config,
     sqlalchemy_plugin,
     template_config,
+    warm_template_cache,
 )
 from .events import all_listeners
 from .routers import routers
@@ -24,6 +25,7 @@ app = Litestar(
     route_handlers=routers,
     dependencies=dependencies,
     on_app_init=[jwt_cookie_auth.on_app_init],
+    on_startup=[warm_template_cache],
     plugins=[sqlalchemy_plugin, htmx_plugin],
     openapi_config=openapi_config,
     template_config=template_config,
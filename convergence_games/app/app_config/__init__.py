@@ -6,7 +6,7 @@ from .init_sentry import init_sentry
 from .jwt_cookie_auth import jwt_cookie_auth
 from .openapi_config import openapi_config
 from .sqlalchemy_plugin import sqlalchemy_plugin
-from .template_config import template_config
+from .template_config import template_config, warm_template_cache
 
 __all__ = [
     "compression_config",
@@ -18,4 +18,5 @@ __all__ = [
     "openapi_config",
     "sqlalchemy_plugin",
     "template_config",
+    "warm_template_cache",
 ]
@@ -12,6 +12,8 @@ config = SQLAlchemyAsyncConfig(
         echo=SETTINGS.DATABASE_ECHO,
         pool_pre_ping=True,
         pool_recycle=SETTINGS.DATABASE_POOL_RECYCLE,
+        pool_size=SETTINGS.DATABASE_POOL_SIZE,
+        max_overflow=SETTINGS.DATABASE_MAX_OVERFLOW,
     ),
     alembic_config=AlembicAsyncConfig(
         script_location="convergence_games/migrations",
@@ -6,7 +6,7 @@ from urllib.parse import quote, unquote
 
 import jinjax
 from humanize import naturaldelta
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.template.config import TemplateConfig
 
@@ -14,10 +14,12 @@ from convergence_games.app.paths import COMPONENTS_DIR_PATH, TEMPLATES_DIR_PATH
 from convergence_games.db.enums import (
     GameActivityRequirement,
     GameCoreActivity,
+    GameCrunch,
     GameEquipmentRequirement,
     GameKSP,
     GameRoomRequirement,
     GameTableSizeRequirement,
+    GameTone,
     RoomFacility,
     TableFacility,
 )
@@ -68,6 +70,9 @@ class JinjaXWithRequestPassthrough(jinjax.JinjaX):
         return super()._build_call(tag, attrs_list, content)
 
 
+# Checking template files for changes on every render is only useful while developing
+AUTO_RELOAD_TEMPLATES = SETTINGS.ENVIRONMENT == "development"
+
 jinja_env = Environment(
     loader=FileSystemLoader(searchpath=TEMPLATES_DIR_PATH),
     extensions=[
@@ -75,6 +80,9 @@ jinja_env = Environment(
     ],
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=AUTO_RELOAD_TEMPLATES,
+    # Compiled templates are shared through the temp dir, so restarted workers skip recompiling them
+    bytecode_cache=None if AUTO_RELOAD_TEMPLATES else FileSystemBytecodeCache(),
 )
 
 jinja_env.filters["debug"] = debug
@@ -109,9 +117,26 @@ jinja_env.globals["utcnow"] = lambda: datetime.now(tz=timezone.utc)
 jinja_env.globals["now"] = datetime.now
 jinja_env.globals["dumps"] = lambda o: json.dumps(o, separators=(",", ":"))
 
-catalog = jinjax.Catalog(jinja_env=jinja_env)
+# Choices for the game submission form
+jinja_env.globals["tones"] = GameTone
+jinja_env.globals["crunches"] = GameCrunch
+jinja_env.globals["core_activities"] = GameCoreActivity
+jinja_env.globals["ksps"] = GameKSP
+jinja_env.globals["table_size_requirements"] = GameTableSizeRequirement
+jinja_env.globals["equipment_requirements"] = GameEquipmentRequirement
+jinja_env.globals["activity_requirements"] = GameActivityRequirement
+jinja_env.globals["room_requirements"] = GameRoomRequirement
+
+catalog = jinjax.Catalog(jinja_env=jinja_env, auto_reload=AUTO_RELOAD_TEMPLATES)
 catalog.add_folder(COMPONENTS_DIR_PATH)
 
+
+def warm_template_cache() -> None:
+    # Compile every page template at startup so the first request to each page doesn't pay for parsing it
+    for template_name in jinja_env.list_templates(extensions=["jinja"]):
+        jinja_env.get_template(template_name)
+
+
 template_engine = JinjaTemplateEngine.from_environment(jinja_env)
 
 template_config = TemplateConfig(engine=template_engine)
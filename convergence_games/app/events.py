@@ -35,7 +35,9 @@ async def event_email_sign_in(
         await session.commit()
         await session.refresh(user_email_verification_code)
 
-    print(f"event_email_sign_in, email: {email}, new_code: {code}")
+    if SETTINGS.DEBUG:
+        # Handy for signing in locally without email, but never worth paying for (or leaking) in production
+        print(f"event_email_sign_in, email: {email}, new_code: {code}")
     magic_link_code = UserEmailVerificationCode.generate_magic_link_code(code, email)
     magic_link_url = f"{SETTINGS.BASE_DOMAIN}/email-auth/magic-link?code={magic_link_code}&state={state.encode()}"
 
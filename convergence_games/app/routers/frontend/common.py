@@ -4,10 +4,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.base import ExecutableOption
 
+from convergence_games.app.request_type import Request
 from convergence_games.db.models import Event
 from convergence_games.db.ocean import Sqid, sink
 from convergence_games.settings import SETTINGS
 
+STATIC_PAGE_CACHE_SECONDS = 60
+
 
 def event_with(*options: ExecutableOption) -> Provide:
     """Dependency factory that loads an Event by sqid, falling back to the default event."""
@@ -18,9 +21,20 @@ def event_with(*options: ExecutableOption) -> Provide:
     ) -> Event:
         event_id: int = sink(event_sqid) if event_sqid is not None else SETTINGS.DEFAULT_EVENT_ID
         stmt = select(Event).options(*options).where(Event.id == event_id)
-        event = (await transaction.execute(stmt)).scalar_one_or_none()
+        # unique() lets callers pass joinedload() options for collections without extra handling
+        event = (await transaction.execute(stmt)).unique().scalar_one_or_none()
         if event is None:
             raise HTTPException(status_code=404, detail="Event not found")
         return event
 
     return Provide(wrapper)
+
+
+def static_page_cache_key(request: Request) -> str:
+    """Response cache key for pages whose only dynamic parts are the signed-in user and the HTMX target block.
+
+    The query string is left out since these pages take no parameters, so junk queries can't grow the cache. The navbar
+    (user name and roles) can be up to STATIC_PAGE_CACHE_SECONDS out of date after a profile or role change.
+    """
+    user_id = request.user.id if request.user is not None else None
+    return f"{request.url.path}:{request.headers.get('hx-target')}:{user_id}"
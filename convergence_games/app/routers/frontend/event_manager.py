@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime as dt
 import itertools
 import zoneinfo
+from collections import Counter
 from collections.abc import Sequence
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
@@ -10,13 +11,13 @@ from typing import Annotated, Any, Literal, TypedDict, cast
 
 import humanize
 from litestar import Controller, Response, get, post, put
+from litestar.concurrency import sync_to_thread
 from litestar.di import Provide
 from litestar.exceptions import HTTPException
 from litestar.params import Body, Parameter, RequestEncodingType
 from litestar.response import Redirect, Template
 from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT
 from pydantic import BaseModel, BeforeValidator
-from rich.pretty import pprint
 from sqlalchemy import bindparam, delete, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -247,7 +248,6 @@ async def add_transaction_with_delta(
     )
     transaction.add(new_transaction_row)
     await transaction.flush()
-    await transaction.refresh(new_transaction_row)
 
     template_str = catalog.render(
         "UserManageDelta",
@@ -324,9 +324,7 @@ class EventManagerController(Controller):
         path="/event/{event_sqid:str}/manage-schedule",
         guards=[user_guard],
         dependencies={
-            "event": event_with(
-                selectinload(Event.sessions),
-            ),
+            "event": event_with(),
             "permission": permission_check(user_can_manage_submissions),
         },
     )
@@ -337,40 +335,29 @@ class EventManagerController(Controller):
         transaction: AsyncSession,
         data: Annotated[PutEventManageScheduleForm, Body(media_type=RequestEncodingType.JSON)],
     ) -> Response[str]:
-        print(data)
         # Set the event's sessions to the new data - including deleting any existing sessions
-        new_sessions: list[Session] = []
-
+        # Done with one DELETE and one INSERT, rather than loading every session and deleting the orphans one by one
+        delete_existing_sessions_stmt = delete(Session).where(Session.event_id == event.id)
         if not data.commit:
             # We are not committing, so don't remove existing committed sessions
-            new_sessions = [s for s in event.sessions if s.committed]
-
-        for session_data in data.sessions:
-            new_sessions.append(
-                Session(
-                    game_id=session_data.game,
-                    table_id=session_data.table,
-                    time_slot_id=session_data.time_slot,
-                    event_id=event.id,
-                    committed=False,
-                )
-            )
-            if data.commit:
-                # Also add a committed session for the game
-                new_sessions.append(
-                    Session(
-                        game_id=session_data.game,
-                        table_id=session_data.table,
-                        time_slot_id=session_data.time_slot,
-                        event_id=event.id,
-                        committed=True,
-                    )
-                )
-
-        event.sessions = new_sessions
-
-        # Save the event
-        transaction.add(event)
+            delete_existing_sessions_stmt = delete_existing_sessions_stmt.where(~Session.committed)
+        _ = await transaction.execute(delete_existing_sessions_stmt)
+
+        # When committing, also add a committed session for each game
+        committed_values = [False, True] if data.commit else [False]
+        new_sessions = [
+            {
+                "game_id": session_data.game,
+                "table_id": session_data.table,
+                "time_slot_id": session_data.time_slot,
+                "event_id": event.id,
+                "committed": committed,
+            }
+            for session_data in data.sessions
+            for committed in committed_values
+        ]
+        if new_sessions:
+            _ = await transaction.execute(insert(Session), new_sessions)
 
         return Response(content="", status_code=HTTP_204_NO_CONTENT)
 
@@ -448,6 +435,14 @@ class EventManagerController(Controller):
         sort: Literal["title", "system", "gamemaster", "submitted", "status", "sessions"] = "submitted",
         desc: bool = False,
     ) -> Template:
+        system_ids: set[int] = set()
+        gamemaster_ids: set[int] = set()
+        sessions_by_status: Counter[SubmissionStatus] = Counter()
+        for game in games:
+            system_ids.add(game.system_id)
+            gamemaster_ids.add(game.gamemaster_id)
+            sessions_by_status[game.submission_status] += game.game_requirement.times_to_run
+
         return HTMXBlockTemplate(
             template_name="pages/event_manage_submissions.html.jinja",
             block_name=request.htmx.target,
@@ -458,44 +453,14 @@ class EventManagerController(Controller):
                 "desc": desc,
                 "submission_status": SubmissionStatus,
                 "total_games": len(games),
-                "total_systems": len({game.system.id for game in games}),
-                "total_gamemasters": len({game.gamemaster.id for game in games}),
-                "total_sessions": sum([game.game_requirement.times_to_run for game in games]),
-                "total_approved_sessions": sum(
-                    [
-                        game.game_requirement.times_to_run
-                        for game in games
-                        if game.submission_status == SubmissionStatus.APPROVED
-                    ]
-                ),
-                "total_draft_sessions": sum(
-                    [
-                        game.game_requirement.times_to_run
-                        for game in games
-                        if game.submission_status == SubmissionStatus.DRAFT
-                    ]
-                ),
-                "total_submitted_sessions": sum(
-                    [
-                        game.game_requirement.times_to_run
-                        for game in games
-                        if game.submission_status == SubmissionStatus.SUBMITTED
-                    ]
-                ),
-                "total_rejected_sessions": sum(
-                    [
-                        game.game_requirement.times_to_run
-                        for game in games
-                        if game.submission_status == SubmissionStatus.REJECTED
-                    ]
-                ),
-                "total_cancelled_sessions": sum(
-                    [
-                        game.game_requirement.times_to_run
-                        for game in games
-                        if game.submission_status == SubmissionStatus.CANCELLED
-                    ]
-                ),
+                "total_systems": len(system_ids),
+                "total_gamemasters": len(gamemaster_ids),
+                "total_sessions": sessions_by_status.total(),
+                "total_approved_sessions": sessions_by_status[SubmissionStatus.APPROVED],
+                "total_draft_sessions": sessions_by_status[SubmissionStatus.DRAFT],
+                "total_submitted_sessions": sessions_by_status[SubmissionStatus.SUBMITTED],
+                "total_rejected_sessions": sessions_by_status[SubmissionStatus.REJECTED],
+                "total_cancelled_sessions": sessions_by_status[SubmissionStatus.CANCELLED],
             },
         )
 
@@ -656,6 +621,7 @@ class EventManagerController(Controller):
         sessions_by_gm_id: dict[int, list[Sqid]] = {}
         for session in sessions:
             sessions_by_gm_id.setdefault(session.game.gamemaster_id, []).append(swim(session))
+        session_results = [(s.id, s.game_id, s.game.classification == GameClassification.R18) for s in sessions]
 
         party_subq = (
             select(Party, PartyUserLink)
@@ -697,7 +663,7 @@ class EventManagerController(Controller):
                 )
             ),
         )
-        groups = [r.tuple() for r in (await transaction.execute(solo_players_and_leaders_stmt)).all()]
+        groups = (await transaction.execute(solo_players_and_leaders_stmt)).tuples().all()
         group_dict: dict[
             int | None, list[tuple[User, Party | None, UserCheckinStatus | None, AllocationPartyMetadata]]
         ] = {}
@@ -738,7 +704,7 @@ class EventManagerController(Controller):
                 user_preferences_to_alg_preferences(
                     list(allocated_or_current_game_preferences.values()),
                     has_d20,
-                    [(s.id, s.game_id, s.game.classification == GameClassification.R18) for s in sessions],
+                    session_results,
                     already_played_games,
                     over_18=over_18,
                 )
@@ -829,9 +795,8 @@ class EventManagerController(Controller):
 
         sessions, parties = await adapt_to_inputs(transaction, time_slot_id)
         game_allocator = GameAllocator(max_iterations=5000, debug_print=False)
-        alg_results, compensation = game_allocator.allocate(sessions, parties, False)
-        pprint(alg_results)
-        pprint(compensation)
+        # The allocation is pure CPU work on plain data, so keep it off the event loop while it runs
+        alg_results, compensation = await sync_to_thread(game_allocator.allocate, sessions, parties, False)
         await adapt_results_to_database(transaction, time_slot_id, alg_results, compensation)
 
         return Redirect(f"/event/{swim(event)}/manage-allocation/{time_slot_sqid}")
@@ -922,25 +887,21 @@ class EventManagerController(Controller):
         time_slot_id = sink(time_slot_sqid)
         user_id = sink(user_sqid)
 
-        checkin_status = (
-            (
-                await transaction.execute(
-                    select(UserCheckinStatus).where(
-                        UserCheckinStatus.user_id == user_id, UserCheckinStatus.time_slot_id == time_slot_id
-                    )
-                )
-            )
-            .scalars()
-            .one_or_none()
-        )
         should_checkin = data.get("checkin", "off") == "on"
 
-        if checkin_status is None:
-            checkin_status = UserCheckinStatus(user_id=user_id, time_slot_id=time_slot_id, checked_in=should_checkin)
-        else:
-            checkin_status.checked_in = should_checkin
-
-        transaction.add(checkin_status)
+        insert_checkin_status_stmt = (
+            insert(UserCheckinStatus)
+            .values(user_id=user_id, time_slot_id=time_slot_id, checked_in=should_checkin)
+            .on_conflict_do_update(
+                index_elements=(UserCheckinStatus.user_id, UserCheckinStatus.time_slot_id),
+                set_={
+                    UserCheckinStatus.checked_in: should_checkin,
+                    UserCheckinStatus.updated_at: dt.datetime.now(tz=dt.timezone.utc),
+                    UserCheckinStatus.updated_by: user_id_ctx.get(),
+                },
+            )
+        )
+        _ = await transaction.execute(insert_checkin_status_stmt)
 
         return "checked-in"
 
@@ -969,33 +930,6 @@ class EventManagerController(Controller):
         if time_slot is None:
             raise HTTPException(status_code=404, detail="Time slot not found")
 
-        # Update the allocations to match the new data
-        new_allocations: list[Allocation] = []
-
-        for allocation_data in data.allocations:
-            if allocation_data.session is None:
-                # No session allocated, skip
-                # This'll go to overflow
-                continue
-
-            new_allocations.append(
-                Allocation(
-                    party_leader_id=allocation_data.leader,
-                    session_id=allocation_data.session,
-                    committed=False,
-                )
-            )
-
-            if data.commit:
-                # Also add a committed allocation for the party leader
-                new_allocations.append(
-                    Allocation(
-                        party_leader_id=allocation_data.leader,
-                        session_id=allocation_data.session,
-                        committed=True,
-                    )
-                )
-
         time_slot.status = TimeSlotStatus.ALLOCATED if data.commit else TimeSlotStatus.ALLOCATING
         transaction.add(time_slot)
 
@@ -1005,8 +939,21 @@ class EventManagerController(Controller):
         )
         _ = await transaction.execute(delete_existing_allocations_stmt)
 
-        # Add new allocations
-        transaction.add_all(new_allocations)
+        # Add the new allocations in one bulk INSERT. Parties with no session go to overflow, so are skipped.
+        # When committing, also add a committed allocation for each party leader
+        committed_values = [False, True] if data.commit else [False]
+        new_allocations = [
+            {
+                "party_leader_id": allocation_data.leader,
+                "session_id": allocation_data.session,
+                "committed": committed,
+            }
+            for allocation_data in data.allocations
+            if allocation_data.session is not None
+            for committed in committed_values
+        ]
+        if new_allocations:
+            _ = await transaction.execute(insert(Allocation), new_allocations)
 
         return Response(content="", status_code=HTTP_204_NO_CONTENT)
 
@@ -1068,13 +1015,13 @@ class EventManagerController(Controller):
                 )
             ),
         )
-        allocations = [r.tuple() for r in (await transaction.execute(solo_players_and_leaders_stmt)).all()]
+        allocations = (await transaction.execute(solo_players_and_leaders_stmt)).tuples().all()
         gm_user_ids_this_session_stmt = (
             select(Session.id, Session.game_id, Game.gamemaster_id)
             .select_from(Session)
             .join(Game, (Session.time_slot_id == time_slot_id) & (Session.game_id == Game.id) & (Session.committed))
         )
-        gm_user_ids_this_session = [r.tuple() for r in (await transaction.execute(gm_user_ids_this_session_stmt)).all()]
+        gm_user_ids_this_session = (await transaction.execute(gm_user_ids_this_session_stmt)).tuples().all()
         session_game_id_map = {r[0]: r[1] for r in gm_user_ids_this_session}
         session_gm_id_map = {r[0]: r[2] for r in gm_user_ids_this_session}
         party_member_mapping: dict[int, list[int]] = {
@@ -1094,7 +1041,6 @@ class EventManagerController(Controller):
             for party_leader, _, allocation, gamemaster_id in allocations
         ]
         compensation = calculate_compensation(sessions, parties, results)
-        print(compensation)
 
         # SHARED INFORMATION - EXISTING TRANSACTIONS
         transaction.expunge_all()
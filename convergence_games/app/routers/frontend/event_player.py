@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import time
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
@@ -13,7 +14,7 @@ from litestar.response import Template
 from pydantic import BaseModel, BeforeValidator
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, selectinload, with_loader_criteria
+from sqlalchemy.orm import aliased, raiseload, selectinload, with_loader_criteria
 
 from convergence_games.app.guards import user_guard
 from convergence_games.app.request_type import Request
@@ -49,6 +50,8 @@ from convergence_games.permissions import user_has_permission
 # region Data Schema
 SqidInt = Annotated[int, BeforeValidator(sink)]
 
+EVENT_FILTER_OPTIONS_TTL_SECONDS = 30
+
 
 class EventGamesQuery(BaseModel):
     genre: list[SqidInt] = []
@@ -91,10 +94,13 @@ async def get_event_approved_games_dep(
         .options(
             selectinload(Game.system),
             selectinload(Game.gamemaster),
-            selectinload(Game.game_requirement),
             selectinload(Game.genres),
             selectinload(Game.content_warnings),
-            selectinload(Game.event).selectinload(Event.time_slots),
+            # The event's time slots are already loaded into this session by the event dependency
+            selectinload(Game.event),
+            # Every relationship the game cards read is loaded above, so make any new one fail loudly instead of
+            # silently rendering as empty
+            raiseload("*"),
         )
         .order_by(Game.name)
         .where(
@@ -125,13 +131,17 @@ async def get_event_approved_games_dep(
                 .exists()
             )
         else:
-            stmt = stmt.join(UserGamePreference, UserGamePreference.game_id == Game.id).where(
-                UserGamePreference.user_id == request.user.id
+            # EXISTS rather than a join, so frozen copies of a preference can't repeat the game
+            stmt = stmt.where(
+                Game.user_preferences.any(
+                    (UserGamePreference.user_id == request.user.id)
+                    & (UserGamePreference.frozen_at_time_slot_id.is_(None))
+                )
             )
     if query_params.session:
-        stmt = stmt.join(Session, Session.game_id == Game.id).where(
-            Session.time_slot_id.in_(query_params.session),
-            Session.committed,
+        # EXISTS rather than a join, so a game running in several of the chosen sessions is only listed once
+        stmt = stmt.where(
+            Game.sessions.any(Session.time_slot_id.in_(query_params.session) & Session.committed),
         )
     games = (await transaction.execute(stmt)).scalars().all()
     return games
@@ -159,65 +169,98 @@ async def event_games_query_from_params_dep(
     )
 
 
+# The tone and bonus filters come straight from the enums, so only need building once
+TONE_VALUES: tuple[str, ...] = tuple(tone.value for tone in GameTone)
+BONUS_LABELS: tuple[tuple[int, str], ...] = tuple((bonus.value, bonus.notes[0]) for bonus in GameKSP)
+
+
+@dataclass(frozen=True, slots=True)
+class EventFilterOptions:
+    # (id, name, sqid) so the sqids are only encoded when the options are loaded
+    genres: list[tuple[int, str, str]]
+    systems: list[tuple[int, str, str]]
+    content_warnings: list[tuple[int, str, str]]
+    loaded_at: float
+
+
+# The genres, systems and content warnings used by an event's approved games rarely change, but were queried for
+# every games page load
+_event_filter_options_cache: dict[int, EventFilterOptions] = {}
+
+
+def invalidate_event_filter_options(event_id: int) -> None:
+    _event_filter_options_cache.pop(event_id, None)
+
+
+async def get_event_filter_options(transaction: AsyncSession, event_id: int) -> EventFilterOptions:
+    cached = _event_filter_options_cache.get(event_id)
+    if cached is not None and time.monotonic() - cached.loaded_at < EVENT_FILTER_OPTIONS_TTL_SECONDS:
+        return cached
+
+    approved_event_games = (Game.event_id == event_id) & (Game.submission_status == SubmissionStatus.APPROVED)
+    genres = (
+        await transaction.execute(
+            select(Genre.id, Genre.name)
+            .join(GameGenreLink, GameGenreLink.genre_id == Genre.id)
+            .join(Game, Game.id == GameGenreLink.game_id)
+            .where(approved_event_games)
+            .order_by(Genre.name)
+            .distinct()
+        )
+    ).tuples()
+    systems = (
+        await transaction.execute(
+            select(System.id, System.name)
+            .join(Game, Game.system_id == System.id)
+            .where(approved_event_games)
+            .order_by(System.name)
+            .distinct()
+        )
+    ).tuples()
+    content_warnings = (
+        await transaction.execute(
+            select(ContentWarning.id, ContentWarning.name)
+            .join(GameContentWarningLink, GameContentWarningLink.content_warning_id == ContentWarning.id)
+            .join(Game, Game.id == GameContentWarningLink.game_id)
+            .where(approved_event_games)
+            .order_by(ContentWarning.name)
+            .distinct()
+        )
+    ).tuples()
+
+    options = EventFilterOptions(
+        genres=[(genre_id, name, swim("Genre", genre_id)) for genre_id, name in genres],
+        systems=[(system_id, name, swim("System", system_id)) for system_id, name in systems],
+        content_warnings=[
+            (content_warning_id, name, swim("ContentWarning", content_warning_id))
+            for content_warning_id, name in content_warnings
+        ],
+        loaded_at=time.monotonic(),
+    )
+    _event_filter_options_cache[event_id] = options
+    return options
+
+
 async def get_form_data_dep(
     transaction: AsyncSession,
     event: Event,
     query_params: EventGamesQuery,
 ) -> dict[str, MultiselectFormData]:
-    all_present_genres = (
-        (
-            await transaction.execute(
-                select(Genre)
-                .join(GameGenreLink, GameGenreLink.genre_id == Genre.id)
-                .join(Game, Game.id == GameGenreLink.game_id)
-                .where(Game.event_id == event.id)
-                .where(Game.submission_status == SubmissionStatus.APPROVED)
-                .order_by(Genre.name)
-                .distinct()
-            )
-        )
-        .scalars()
-        .all()
-    )
-    all_present_systems = (
-        (
-            await transaction.execute(
-                select(System)
-                .join(Game, Game.system_id == System.id)
-                .where(Game.event_id == event.id)
-                .where(Game.submission_status == SubmissionStatus.APPROVED)
-                .order_by(System.name)
-                .distinct()
-            )
-        )
-        .scalars()
-        .all()
-    )
-    all_present_content_warnings = (
-        (
-            await transaction.execute(
-                select(ContentWarning)
-                .join(GameContentWarningLink, GameContentWarningLink.content_warning_id == ContentWarning.id)
-                .join(Game, Game.id == GameContentWarningLink.game_id)
-                .where(Game.event_id == event.id)
-                .where(Game.submission_status == SubmissionStatus.APPROVED)
-                .order_by(ContentWarning.name)
-                .distinct()
-            )
-        )
-        .scalars()
-        .all()
-    )
-    all_tones = list(GameTone)
-    all_bonus = list(GameKSP)
+    filter_options = await get_event_filter_options(transaction, event.id)
+    selected_genres = set(query_params.genre)
+    selected_systems = set(query_params.system)
+    selected_tones = set(query_params.tone)
+    selected_bonus = set(query_params.bonus)
+    selected_content = set(query_params.content)
+    selected_sessions = set(query_params.session)
 
     return {
         "genre": MultiselectFormData(
             label="Genre",
             name="genre",
             options=[
-                MultiselectFormDataOption(label=genre.name, value=swim(genre), selected=genre.id in query_params.genre)
-                for genre in all_present_genres
+                MultiselectFormDataOption(label=genre_name, value=genre_sqid, selected=genre_id in selected_genres)
+                for genre_id, genre_name, genre_sqid in filter_options.genres
             ],
             description="Find games tagged with any of these genres:",
         ),
@@ -225,10 +268,8 @@ async def get_form_data_dep(
             label="System",
             name="system",
             options=[
-                MultiselectFormDataOption(
-                    label=system.name, value=swim(system), selected=system.id in query_params.system
-                )
-                for system in all_present_systems
+                MultiselectFormDataOption(label=system_name, value=system_sqid, selected=system_id in selected_systems)
+                for system_id, system_name, system_sqid in filter_options.systems
             ],
             description="Find games using any of these systems:",
         ),
@@ -236,8 +277,8 @@ async def get_form_data_dep(
             label="Tone",
             name="tone",
             options=[
-                MultiselectFormDataOption(label=tone.value, value=tone.value, selected=tone.value in query_params.tone)
-                for tone in all_tones
+                MultiselectFormDataOption(label=tone_value, value=tone_value, selected=tone_value in selected_tones)
+                for tone_value in TONE_VALUES
             ],
             description="Find games with any of these tones:",
         ),
@@ -246,9 +287,9 @@ async def get_form_data_dep(
             name="bonus",
             options=[
                 MultiselectFormDataOption(
-                    label=bonus.notes[0], value=str(bonus.value), selected=bonus.value in query_params.bonus
+                    label=bonus_label, value=str(bonus_value), selected=bonus_value in selected_bonus
                 )
-                for bonus in all_bonus
+                for bonus_value, bonus_label in BONUS_LABELS
             ],
             description="Find games with any of these bonus features:",
         ),
@@ -257,11 +298,11 @@ async def get_form_data_dep(
             name="content",
             options=[
                 MultiselectFormDataOption(
-                    label=content_warning.name,
-                    value=swim(content_warning),
-                    selected=content_warning.id in query_params.content,
+                    label=content_warning_name,
+                    value=content_warning_sqid,
+                    selected=content_warning_id in selected_content,
                 )
-                for content_warning in all_present_content_warnings
+                for content_warning_id, content_warning_name, content_warning_sqid in filter_options.content_warnings
             ],
             description='Find games <span class="text-warning font-semibold">EXCLUDING</span> any of these content warnings:',
         ),
@@ -289,7 +330,7 @@ async def get_form_data_dep(
                 MultiselectFormDataOption(
                     label=time_slot.name,
                     value=swim(time_slot),
-                    selected=time_slot.id in query_params.session,
+                    selected=time_slot.id in selected_sessions,
                 )
                 for time_slot in sorted(event.time_slots, key=lambda ts: ts.start_time)
             ],
@@ -356,13 +397,10 @@ class EventPlayerController(Controller):
         transaction: AsyncSession,
     ) -> Template:
         scheduled_time_slots_stmt = select(Session.game_id, Session.time_slot_id).where(Session.committed)
-        scheduled_time_slots = (await transaction.execute(scheduled_time_slots_stmt)).all()
+        scheduled_time_slots = (await transaction.execute(scheduled_time_slots_stmt)).tuples().all()
         scheduled_time_slots_dict: dict[int, list[int]] = {}
-        for r in scheduled_time_slots:
-            game_id, time_slot_id = r.tuple()
-            if game_id not in scheduled_time_slots_dict:
-                scheduled_time_slots_dict[game_id] = []
-            scheduled_time_slots_dict[game_id].append(time_slot_id)
+        for game_id, time_slot_id in scheduled_time_slots:
+            scheduled_time_slots_dict.setdefault(game_id, []).append(time_slot_id)
 
         if request.user:
             latest_d20_transaction = (
@@ -491,10 +529,11 @@ class EventPlayerController(Controller):
             .options(
                 selectinload(Game.system),
                 selectinload(Game.gamemaster),
-                selectinload(Game.game_requirement),
                 selectinload(Game.genres),
                 selectinload(Game.content_warnings),
                 selectinload(Game.event),
+                # Same as the games page - the game cards read nothing else, so fail loudly on any new relationship
+                raiseload("*"),
             )
             .join(Session, Session.game_id == Game.id)
             .where(
@@ -526,13 +565,10 @@ class EventPlayerController(Controller):
 
         games_and_preferences = (await transaction.execute(games_and_preferences_this_time_slot_stmt)).all()
         scheduled_time_slots_stmt = select(Session.game_id, Session.time_slot_id).where(Session.committed)
-        scheduled_time_slots = (await transaction.execute(scheduled_time_slots_stmt)).all()
+        scheduled_time_slots = (await transaction.execute(scheduled_time_slots_stmt)).tuples().all()
         scheduled_time_slots_dict: dict[int, list[int]] = {}
-        for r in scheduled_time_slots:
-            game_id, time_slot_id = r.tuple()
-            if game_id not in scheduled_time_slots_dict:
-                scheduled_time_slots_dict[game_id] = []
-            scheduled_time_slots_dict[game_id].append(time_slot_id)
+        for game_id, time_slot_id in scheduled_time_slots:
+            scheduled_time_slots_dict.setdefault(game_id, []).append(time_slot_id)
 
         all_party_members_game_playeds_stmt = (
             select(UserGamePlayed)
@@ -581,9 +617,7 @@ class EventPlayerController(Controller):
                 if party_leader.id == user.id:
                     downgraded_d20 = True
 
-            if tier_value not in game_tier_dict:
-                game_tier_dict[tier_value] = []
-            game_tier_dict[tier_value].append(game)
+            game_tier_dict.setdefault(tier_value, []).append(game)
 
         game_tier_list = sorted(game_tier_dict.items(), key=lambda item: item[0].value, reverse=True)
 
@@ -1,3 +1,4 @@
+import datetime as dt
 from typing import Annotated
 
 from litestar import Controller, Response, get, put
@@ -5,10 +6,12 @@ from litestar.exceptions import HTTPException
 from litestar.params import Body, RequestEncodingType
 from pydantic import BaseModel
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
 from convergence_games.app.alerts import Alert, AlertError
+from convergence_games.app.context import user_id_ctx
 from convergence_games.app.request_type import Request
 from convergence_games.app.response_type import HTMXBlockTemplate, Template
 from convergence_games.db.enums import UserGamePreferenceValue
@@ -17,6 +20,7 @@ from convergence_games.db.models import (
     Game,
     Session,
     Table,
+    TimeSlot,
     User,
     UserEventD20Transaction,
     UserGamePlayed,
@@ -67,36 +71,35 @@ class GameController(Controller):
             raise HTTPException(status_code=404, detail="Game not found")
 
         if request.user:
-            user_game_preference = (
+            # One round-trip for all of the per-user state shown on the page
+            preference, d20_balance, allow_play_again = (
                 await transaction.execute(
-                    select(UserGamePreference).where(
-                        UserGamePreference.game_id == game_id,
-                        UserGamePreference.user_id == request.user.id,
-                        UserGamePreference.frozen_at_time_slot_id.is_(None),
+                    select(
+                        select(UserGamePreference.preference)
+                        .where(
+                            UserGamePreference.game_id == game_id,
+                            UserGamePreference.user_id == request.user.id,
+                            UserGamePreference.frozen_at_time_slot_id.is_(None),
+                        )
+                        .scalar_subquery(),
+                        select(UserEventD20Transaction.current_balance)
+                        .where(
+                            UserEventD20Transaction.user_id == request.user.id,
+                            UserEventD20Transaction.event_id == game.event_id,
+                        )
+                        .order_by(UserEventD20Transaction.id.desc())
+                        .limit(1)
+                        .scalar_subquery(),
+                        select(UserGamePlayed.allow_play_again)
+                        .where(UserGamePlayed.user_id == request.user.id, UserGamePlayed.game_id == game_id)
+                        .scalar_subquery(),
                     )
                 )
-            ).scalar_one_or_none()
-            preference = user_game_preference.preference if user_game_preference else None
-            latest_d20_transaction = (
-                await transaction.execute(
-                    select(UserEventD20Transaction)
-                    .where(UserEventD20Transaction.user_id == request.user.id)
-                    .where(UserEventD20Transaction.event_id == game.event_id)
-                    .order_by(UserEventD20Transaction.id.desc())
-                    .limit(1)
-                )
-            ).scalar_one_or_none()
-            user_game_played = (
-                await transaction.execute(
-                    select(UserGamePlayed).where(
-                        UserGamePlayed.user_id == request.user.id, UserGamePlayed.game_id == game_id
-                    )
-                )
-            ).scalar_one_or_none()
+            ).one()
         else:
             preference = None
-            latest_d20_transaction = None
-            user_game_played = None
+            d20_balance = None
+            allow_play_again = None
 
         game_image_urls = [
             {
@@ -110,14 +113,16 @@ class GameController(Controller):
             (
                 await transaction.execute(
                     select(Session)
+                    .join(Session.time_slot)
                     .where(
                         Session.game_id == game_id,
                         Session.committed,
                     )
                     .options(
                         selectinload(Session.table).selectinload(Table.room),
-                        selectinload(Session.time_slot),
+                        contains_eager(Session.time_slot),
                     )
+                    .order_by(TimeSlot.start_time)
                 )
             )
             .scalars()
@@ -131,9 +136,9 @@ class GameController(Controller):
                 "game": game,
                 "game_image_urls": game_image_urls,
                 "preference": preference,
-                "user_game_played": user_game_played,
-                "scheduled_sessions": sorted(scheduled_sessions, key=lambda s: s.time_slot.start_time),
-                "has_d20": latest_d20_transaction is not None and latest_d20_transaction.current_balance > 0,
+                "allow_play_again": allow_play_again,
+                "scheduled_sessions": scheduled_sessions,
+                "has_d20": d20_balance is not None and d20_balance > 0,
             },
         )
 
@@ -155,19 +160,26 @@ class GameController(Controller):
             if not user_has_permission(user, "event", (event, event), "manage_submissions"):
                 raise AlertError([Alert("alert-warning", "Preferences are not currently open for this event.")])
 
-        user_game_preference = (
-            await transaction.execute(
-                select(UserGamePreference).where(
-                    UserGamePreference.game_id == game_id,
-                    UserGamePreference.user_id == user.id,
-                    UserGamePreference.frozen_at_time_slot_id.is_(None),
-                )
+        # Upsert in one statement rather than selecting the existing row first
+        insert_user_game_preference_stmt = insert(UserGamePreference).values(
+            game_id=game_id,
+            user_id=user.id,
+            preference=data.rating,
+        )
+        _ = await transaction.execute(
+            insert_user_game_preference_stmt.on_conflict_do_update(
+                index_elements=(
+                    UserGamePreference.game_id,
+                    UserGamePreference.user_id,
+                    UserGamePreference.frozen_at_time_slot_id,
+                ),
+                set_={
+                    UserGamePreference.preference: insert_user_game_preference_stmt.excluded.preference,
+                    UserGamePreference.updated_at: dt.datetime.now(tz=dt.timezone.utc),
+                    UserGamePreference.updated_by: user_id_ctx.get(),
+                },
             )
-        ).scalar_one_or_none()
-        if user_game_preference is None:
-            user_game_preference = UserGamePreference(game_id=game_id, user_id=user.id)
-        user_game_preference.preference = data.rating
-        transaction.add(user_game_preference)
+        )
         return Response(content="", status_code=204)
 
     @put(path="/{game_sqid:str}/already-played")
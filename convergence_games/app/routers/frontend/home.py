@@ -2,13 +2,14 @@ from litestar import Controller, get
 
 from convergence_games.app.request_type import Request
 from convergence_games.app.response_type import HTMXBlockTemplate, Template
+from convergence_games.app.routers.frontend.common import STATIC_PAGE_CACHE_SECONDS, static_page_cache_key
 
 
 class HomeController(Controller):
-    @get(path="/")
+    @get(path="/", cache=STATIC_PAGE_CACHE_SECONDS, cache_key_builder=static_page_cache_key)
     async def get_home(self, request: Request) -> Template:
         return HTMXBlockTemplate(template_name="pages/home.html.jinja", block_name=request.htmx.target)
 
-    @get(path="/faq")
+    @get(path="/faq", cache=STATIC_PAGE_CACHE_SECONDS, cache_key_builder=static_page_cache_key)
     async def get_faq(self, request: Request) -> Template:
         return HTMXBlockTemplate(template_name="pages/faq.html.jinja", block_name=request.htmx.target)
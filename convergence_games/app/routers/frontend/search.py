@@ -1,12 +1,15 @@
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 from litestar import Controller, get
 from litestar.exceptions import NotFoundException
 from rapidfuzz import fuzz, process, utils
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy.sql import ColumnExpressionArgument
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import ColumnElement
 
 from convergence_games.app.request_type import Request
 from convergence_games.app.response_type import HTMXBlockTemplate, Template
@@ -17,13 +20,19 @@ from convergence_games.db.models import (
     ContentWarning,
     Genre,
     System,
+    SystemAlias,
 )
 from convergence_games.db.ocean import Sqid, sink
 
 type SearchableBase = System | Genre | ContentWarning
 
+SEARCH_RESULT_LIMIT = 10
+SHORT_SEARCH_LENGTH = 2
+SEARCH_CHOICES_TTL_SECONDS = 60
+PROCESSED_SEARCH_CACHE_SIZE = 1024
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SearchResult[T: SearchableBase]:
     name: str
     match: str
@@ -31,74 +40,213 @@ class SearchResult[T: SearchableBase]:
     result: T
 
 
-async def search_with_fuzzy_match[T: SearchableBase](
+def _exact_search_results[T: SearchableBase](rows: Sequence[T]) -> list[SearchResult[T]]:
+    return [
+        SearchResult(
+            name=row.name,
+            match=row.name,
+            score=100,
+            result=row,
+        )
+        for row in rows
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class SearchChoices:
+    match_names: list[str]
+    processed_names: list[str]
+    owner_ids: list[int]
+    names_by_id: dict[int, str]
+    loaded_at: float
+
+
+# Approved choices per model type. These are the same for everyone, so there is only ever one entry per type no matter
+# how many users search. Each user's own unapproved entries are few, so they are queried per search instead.
+_search_choices_cache: dict[type[SearchableBase], SearchChoices] = {}
+
+
+def invalidate_search_choices(model_type: type[SearchableBase]) -> None:
+    _search_choices_cache.pop(model_type, None)
+
+
+def visible_to_user_filter(model_type: type[SearchableBase], user_id: int | None) -> ColumnElement[bool]:
+    visible_filter = model_type.submission_status == SubmissionStatus.APPROVED
+    if user_id is not None:
+        visible_filter = visible_filter | (model_type.created_by == user_id)
+    return visible_filter
+
+
+def _fresh_search_choices(model_type: type[SearchableBase]) -> SearchChoices | None:
+    cached = _search_choices_cache.get(model_type)
+    if cached is None:
+        return None
+    if time.monotonic() - cached.loaded_at >= SEARCH_CHOICES_TTL_SECONDS:
+        del _search_choices_cache[model_type]
+        return None
+    return cached
+
+
+async def _load_search_choices(
+    transaction: AsyncSession,
+    model_type: type[SearchableBase],
+    where: ColumnElement[bool],
+) -> SearchChoices:
+    # Just the names and ids, with system aliases joined in as extra names for the same system
+    query = select(model_type.id, model_type.name, literal(False)).where(where)
+    if issubclass(model_type, System):
+        query = query.union_all(
+            select(model_type.id, SystemAlias.name, literal(True))
+            .join(SystemAlias, SystemAlias.system_id == model_type.id)
+            .where(where)
+        )
+    rows = (await transaction.execute(query)).tuples().all()
+
+    match_names = [name for _, name, _ in rows]
+    owner_ids = [owner_id for owner_id, _, _ in rows]
+
+    return SearchChoices(
+        match_names=match_names,
+        # Normalised once here so each search only has to run the scorer
+        processed_names=[utils.default_process(name) for name in match_names],
+        owner_ids=owner_ids,
+        names_by_id={owner_id: name for owner_id, name, is_alias in rows if not is_alias},
+        loaded_at=time.monotonic(),
+    )
+
+
+async def get_search_choices(transaction: AsyncSession, model_type: type[SearchableBase]) -> SearchChoices:
+    cached = _fresh_search_choices(model_type)
+    if cached is not None:
+        return cached
+
+    choices = await _load_search_choices(
+        transaction, model_type, model_type.submission_status == SubmissionStatus.APPROVED
+    )
+    _search_choices_cache[model_type] = choices
+    return choices
+
+
+async def get_own_search_choices(
+    transaction: AsyncSession,
+    model_type: type[SearchableBase],
+    user_id: int,
+) -> SearchChoices:
+    # Not cached - entries still awaiting approval are only visible to the user that created them
+    return await _load_search_choices(
+        transaction,
+        model_type,
+        (model_type.submission_status != SubmissionStatus.APPROVED) & (model_type.created_by == user_id),
+    )
+
+
+# Autocomplete sends the same few search strings over and over as the user types
+@lru_cache(maxsize=PROCESSED_SEARCH_CACHE_SIZE)
+def _process_search(search: str) -> str:
+    return utils.default_process(search)
+
+
+def _extract_matches(search: str, choices: SearchChoices) -> list[tuple[int, str, float]]:
+    names_scores_indices = process.extract(
+        query=_process_search(search),
+        choices=choices.processed_names,
+        scorer=fuzz.WRatio,
+        processor=None,
+        limit=SEARCH_RESULT_LIMIT,
+        score_cutoff=50,
+    )
+    return [(choices.owner_ids[index], choices.match_names[index], score) for _, score, index in names_scores_indices]
+
+
+async def _fuzzy_search_results[T: SearchableBase](
     transaction: AsyncSession,
     model_type: type[T],
     search: str,
-    extra_filters: ColumnExpressionArgument[bool] | None = None,
-    suggested_on_empty: bool = False,
+    user_id: int | None,
 ) -> list[SearchResult[T]]:
-    # TODO: Can we directly query for the names (possibly including aliases) and sqids?
-    query = select(model_type)
+    matches = _extract_matches(search, await get_search_choices(transaction, model_type))
+    if user_id is not None:
+        matches += _extract_matches(search, await get_own_search_choices(transaction, model_type, user_id))
+        matches.sort(key=lambda match: match[2], reverse=True)
+        del matches[SEARCH_RESULT_LIMIT:]
+
+    # The best match for each owner, in score order
+    best_matches: dict[int, tuple[str, float]] = {}
+    for owner_id, match, score in matches:
+        best_matches.setdefault(owner_id, (match, score))
+
+    if not best_matches:
+        return []
+    rows = (
+        (
+            await transaction.execute(
+                select(model_type)
+                .options(load_only(model_type.id, model_type.name))
+                .where(model_type.id.in_(best_matches))
+            )
+        )
+        .scalars()
+        .all()
+    )
+    rows_by_id = {row.id: row for row in rows}
+
+    return [
+        SearchResult(name=rows_by_id[owner_id].name, match=match, score=score, result=rows_by_id[owner_id])
+        for owner_id, (match, score) in best_matches.items()
+        if owner_id in rows_by_id
+    ]
 
-    if issubclass(model_type, System):
-        query = query.options(selectinload(model_type.aliases))
 
-    if extra_filters is not None:
-        query = query.where(extra_filters)
+async def search_with_fuzzy_match[T: SearchableBase](
+    transaction: AsyncSession,
+    model_type: type[T],
+    search: str,
+    user_id: int | None = None,
+    suggested_on_empty: bool = False,
+) -> list[SearchResult[T]]:
+    # Results only show the name and link by id, so leave descriptions and the like behind
+    query = (
+        select(model_type)
+        .options(load_only(model_type.id, model_type.name))
+        .where(visible_to_user_filter(model_type, user_id))
+    )
 
     if not search:
         if suggested_on_empty:
             assert issubclass(model_type, Genre) or issubclass(model_type, ContentWarning)
             query = query.where(model_type.suggested).order_by(model_type.name)
             all_rows = (await transaction.execute(query)).scalars().all()
-            return [
-                SearchResult(
-                    name=row.name,
-                    match=row.name,
-                    score=100,
-                    result=row,
-                )
-                for row in all_rows
-            ]
+            return _exact_search_results(all_rows)
         else:
             return []
 
-    all_rows = (await transaction.execute(query)).scalars().all()
+    # Most searches are the start of the name being looked for, so try a cheap prefix query first and only fall
+    # through to fuzzy matching every name when that doesn't fill the results
+    prefix_query = (
+        query.where(model_type.name.istartswith(search, autoescape=True))
+        .order_by(model_type.name)
+        .limit(SEARCH_RESULT_LIMIT)
+    )
+    prefix_rows = (await transaction.execute(prefix_query)).scalars().all()
+    if len(prefix_rows) >= SEARCH_RESULT_LIMIT or len(search) <= SHORT_SEARCH_LENGTH:
+        return _exact_search_results(prefix_rows)
 
-    to_match: list[tuple[str, T]] = []
-    for row in all_rows:
-        to_match.append((row.name, row))
-        if isinstance(row, System):
-            for alias in row.aliases:
-                to_match.append((alias.name, row))
+    return await _fuzzy_search_results(transaction, model_type, search, user_id)
 
-    names_scores_indices = process.extract(
-        query=search,
-        choices=[name for name, _ in to_match],
-        scorer=fuzz.WRatio,
-        processor=utils.default_process,
-        limit=10,
-        score_cutoff=50,
-    )
 
-    already_matched_ids: set[int] = set()
-    top_results: list[SearchResult[T]] = []
-
-    for _, score, index in names_scores_indices:
-        result = to_match[index][1]
-        if result.id not in already_matched_ids:
-            top_results.append(
-                SearchResult(
-                    name=result.name,
-                    match=to_match[index][0],
-                    score=score,
-                    result=result,
-                )
-            )
-            already_matched_ids.add(result.id)
+async def get_selected_name(
+    transaction: AsyncSession,
+    model_type: type[SearchableBase],
+    selected_id: int,
+) -> str | None:
+    # Selecting a search result is usually straight after searching, so the name is normally already in the cached
+    # choices and the chip can be rendered without a query. A user's own unapproved entries fall back to the database.
+    cached = _fresh_search_choices(model_type)
+    if cached is not None and (name := cached.names_by_id.get(selected_id)) is not None:
+        return name
 
-    return top_results
+    row = await transaction.get(model_type, selected_id)
+    return row.name if row is not None else None
 
 
 class SearchController(Controller):
@@ -119,10 +267,8 @@ class SearchController(Controller):
 
     @get(path="/system/results")
     async def get_system_search_results(self, request: Request, transaction: AsyncSession, search: str) -> Template:
-        extra_filters = System.submission_status == SubmissionStatus.APPROVED
-        if request.user:
-            extra_filters = extra_filters | (System.created_by == request.user.id)
-        results = await search_with_fuzzy_match(transaction, System, search, extra_filters)
+        user_id = request.user.id if request.user else None
+        results = await search_with_fuzzy_match(transaction, System, search, user_id)
 
         return HTMXBlockTemplate(
             template_name="components/forms/search/SearchResultsList.html.jinja",
@@ -136,16 +282,16 @@ class SearchController(Controller):
 
     @get(path="/system/select")
     async def get_system_search_selected(self, transaction: AsyncSession, sqid: Sqid) -> Template:
-        system = await transaction.get(System, sink(sqid))
+        selected_name = await get_selected_name(transaction, System, sink(sqid))
 
-        if not system:
+        if selected_name is None:
             raise NotFoundException(detail="System not found")
 
         return HTMXBlockTemplate(
             template_name="components/forms/search/SearchSelected.html.jinja",
             context={
                 "name": "system",
-                "selected_name": system.name,
+                "selected_name": selected_name,
                 "value": sqid,
             },
         )
@@ -163,10 +309,8 @@ class SearchController(Controller):
 
     @get(path="/genre/results")
     async def get_genre_search_results(self, request: Request, transaction: AsyncSession, search: str) -> Template:
-        extra_filters = Genre.submission_status == SubmissionStatus.APPROVED
-        if request.user:
-            extra_filters = extra_filters | (Genre.created_by == request.user.id)
-        results = await search_with_fuzzy_match(transaction, Genre, search, extra_filters, suggested_on_empty=True)
+        user_id = request.user.id if request.user else None
+        results = await search_with_fuzzy_match(transaction, Genre, search, user_id, suggested_on_empty=True)
 
         return HTMXBlockTemplate(
             template_name="components/forms/search/SearchResultsList.html.jinja",
@@ -180,16 +324,16 @@ class SearchController(Controller):
 
     @get(path="/genre/select")
     async def get_genre_search_selected(self, transaction: AsyncSession, sqid: Sqid) -> Template:
-        genre = await transaction.get(Genre, sink(sqid))
+        selected_name = await get_selected_name(transaction, Genre, sink(sqid))
 
-        if not genre:
+        if selected_name is None:
             raise NotFoundException(detail="Genre not found")
 
         return HTMXBlockTemplate(
             template_name="components/forms/search_checks/SearchCheckChip.html.jinja",
             context={
                 "name": "genre",
-                "selected_name": genre.name,
+                "selected_name": selected_name,
                 "value": sqid,
             },
         )
@@ -209,12 +353,8 @@ class SearchController(Controller):
     async def get_content_warning_search_results(
         self, request: Request, transaction: AsyncSession, search: str
     ) -> Template:
-        extra_filters = ContentWarning.submission_status == SubmissionStatus.APPROVED
-        if request.user:
-            extra_filters = extra_filters | (ContentWarning.created_by == request.user.id)
-        results = await search_with_fuzzy_match(
-            transaction, ContentWarning, search, extra_filters, suggested_on_empty=True
-        )
+        user_id = request.user.id if request.user else None
+        results = await search_with_fuzzy_match(transaction, ContentWarning, search, user_id, suggested_on_empty=True)
 
         return HTMXBlockTemplate(
             template_name="components/forms/search/SearchResultsList.html.jinja",
@@ -228,16 +368,16 @@ class SearchController(Controller):
 
     @get(path="/content-warning/select")
     async def get_content_warning_search_selected(self, transaction: AsyncSession, sqid: Sqid) -> Template:
-        content_warning = await transaction.get(ContentWarning, sink(sqid))
+        selected_name = await get_selected_name(transaction, ContentWarning, sink(sqid))
 
-        if not content_warning:
+        if selected_name is None:
             raise NotFoundException(detail="Content warning not found")
 
         return HTMXBlockTemplate(
             template_name="components/forms/search_checks/SearchCheckChip.html.jinja",
             context={
                 "name": "content_warning",
-                "selected_name": content_warning.name,
+                "selected_name": selected_name,
                 "value": sqid,
             },
         )
@@ -1,5 +1,8 @@
+import asyncio
+import operator
 from dataclasses import dataclass
-from typing import Annotated, Callable, Literal, cast
+from functools import cache, reduce
+from typing import Annotated, Any, Callable, Literal, cast
 from uuid import uuid4
 
 from litestar import Controller, get, post, put
@@ -18,9 +21,11 @@ from pydantic import (
     field_validator,
 )
 from pydantic_core import PydanticCustomError
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import ColumnExpressionArgument
 from sqlalchemy.sql.base import ExecutableOption
 
 from convergence_games.app.alerts import Alert, AlertError
@@ -29,6 +34,7 @@ from convergence_games.app.guards import permission_check, user_guard
 from convergence_games.app.request_type import Request
 from convergence_games.app.response_type import HTMXBlockTemplate, Template
 from convergence_games.app.routers.frontend.common import event_with
+from convergence_games.app.routers.frontend.event_player import invalidate_event_filter_options
 from convergence_games.db.enums import (
     GameActivityRequirement,
     GameClassification,
@@ -62,12 +68,16 @@ from convergence_games.services import ImageLoader
 
 # region Submit Game Form
 class NewValue[T](BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     value: T
 
 
 type SqidOrNew[T] = int | NewValue[T]
 
 
+# Cached so each new value type only builds its TypeAdapter once
+@cache
 def make_sqid_or_new_validator[T](new_value_type: type[T]) -> Callable[[str], SqidOrNew[T]]:
     new_value_type_adapter = TypeAdapter(new_value_type)
 
@@ -79,9 +89,22 @@ def make_sqid_or_new_validator[T](new_value_type: type[T]) -> Callable[[str], Sq
     return sqid_or_new_validator
 
 
-NoneToEmpty = BeforeValidator(lambda value: "" if value is None else value)
-MaybeListValidator = BeforeValidator(lambda value: value if isinstance(value, list) else [value])
-IntFlagValidator = BeforeValidator(lambda value: sum(map(int, value)) if isinstance(value, list) else int(value))
+def none_to_empty(value: Any) -> Any:
+    return "" if value is None else value
+
+
+def maybe_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def int_flag(value: Any) -> int:
+    # Flags combine with bitwise OR - summing would double count any bit submitted more than once
+    return reduce(operator.or_, map(int, value), 0) if isinstance(value, list) else int(value)
+
+
+NoneToEmpty = BeforeValidator(none_to_empty)
+MaybeListValidator = BeforeValidator(maybe_list)
+IntFlagValidator = BeforeValidator(int_flag)
 SqidOrNewStr = Annotated[SqidOrNew[str], BeforeValidator(make_sqid_or_new_validator(str))]
 SqidInt = Annotated[int, BeforeValidator(sink)]
 
@@ -94,6 +117,11 @@ def user_can_edit_game(user: User, game: Game) -> bool:
     return user_has_permission(user, "game", (game.event, game), "update")
 
 
+def resolve_player_count(count: int, count_more: int | None) -> int:
+    # The optional "more" count comes from picking the "+" option, and wins when it's larger
+    return max(count, count_more or 0)
+
+
 class SubmitGameForm(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)  # Required for UploadFile
 
@@ -123,7 +151,7 @@ class SubmitGameForm(BaseModel):
 
     # Stuff that's used for GameRequirement
     times_to_run: Annotated[int, Field(title="Times to Run")] = 1
-    available_time_slot: Annotated[list[SqidInt], MaybeListValidator, Field(title="Available Time Slots")]
+    available_time_slot: Annotated[list[int], Field(title="Available Time Slots")]
     scheduling_notes: Annotated[str, Field(title="Scheduling Notes"), NoneToEmpty] = ""
     table_size_requirement: Annotated[
         GameTableSizeRequirement, IntFlagValidator, Field(title="Table Size Requirements")
@@ -155,21 +183,21 @@ class SubmitGameForm(BaseModel):
 
     @property
     def player_count_minimum_prop(self) -> int:
-        return max(self.player_count_minimum, self.player_count_minimum_more or 0)
+        return resolve_player_count(self.player_count_minimum, self.player_count_minimum_more)
 
     @property
     def player_count_optimum_prop(self) -> int:
-        return max(self.player_count_optimum, self.player_count_optimum_more or 0)
+        return resolve_player_count(self.player_count_optimum, self.player_count_optimum_more)
 
     @property
     def player_count_maximum_prop(self) -> int:
-        return max(self.player_count_maximum, self.player_count_maximum_more or 0)
+        return resolve_player_count(self.player_count_maximum, self.player_count_maximum_more)
 
     @field_validator("player_count_optimum", mode="after")
     @classmethod
     def validate_player_count_optimum(cls, value: int, info: ValidationInfo) -> int:
-        minimum = max(info.data["player_count_minimum"], info.data["player_count_minimum_more"] or 0)
-        optimum = max(value, info.data["player_count_optimum_more"] or 0)
+        minimum = resolve_player_count(info.data["player_count_minimum"], info.data["player_count_minimum_more"])
+        optimum = resolve_player_count(value, info.data["player_count_optimum_more"])
         if optimum < minimum:
             raise PydanticCustomError("", "Optimum player count must be greater than or equal to minimum player count.")
         return value
@@ -177,15 +205,21 @@ class SubmitGameForm(BaseModel):
     @field_validator("player_count_maximum", mode="after")
     @classmethod
     def validate_player_count_maximum(cls, value: int, info: ValidationInfo) -> int:
-        optimum = max(info.data["player_count_optimum"], info.data["player_count_optimum_more"] or 0)
-        maximum = max(value, info.data["player_count_maximum_more"] or 0)
+        optimum = resolve_player_count(info.data["player_count_optimum"], info.data["player_count_optimum_more"])
+        maximum = resolve_player_count(value, info.data["player_count_maximum_more"])
         if maximum < optimum:
             raise PydanticCustomError("", "Maximum player count must be greater than or equal to optimum player count.")
         return value
 
+    @field_validator("available_time_slot", mode="before")
+    @classmethod
+    def decode_available_time_slots(cls, value: Any) -> list[int]:
+        # Decoded in one pass rather than with a validator call per selected time slot
+        return [sink(sqid) for sqid in maybe_list(value)]
+
     @field_validator("available_time_slot", mode="after")
     @classmethod
-    def validate_enough_time_slots_selected(cls, value: list[SqidInt], info: ValidationInfo) -> list[SqidInt]:
+    def validate_enough_time_slots_selected(cls, value: list[int], info: ValidationInfo) -> list[int]:
         if len(value) < info.data["times_to_run"]:
             raise PydanticCustomError("", "You must select at least as many time slots as times to run.")
         return value
@@ -233,13 +267,18 @@ class SubmissionStatusForm(BaseModel):
 
 
 # region Form Error
-@dataclass
+@dataclass(slots=True)
 class FormError:
     field_name: str
     field_title: str
     errors: list[str]
 
 
+SUBMIT_GAME_FIELD_TITLES: dict[str, str] = {
+    field_name: field_info.title or field_name for field_name, field_info in SubmitGameForm.model_fields.items()
+}
+
+
 def handle_submit_game_form_validation_error(request: Request, exc: ValidationException) -> HTMXBlockTemplate:
     error_messages: dict[str, list[str]] = {}
     if exc.extra is not None:
@@ -252,10 +291,8 @@ def handle_submit_game_form_validation_error(request: Request, exc: ValidationEx
             error_messages[field_name].append(message)
 
     form_errors: list[FormError] = [
-        FormError(
-            field_name=field_name, field_title=field_info.title or field_name, errors=error_messages.get(field_name, [])
-        )
-        for field_name, field_info in SubmitGameForm.model_fields.items()
+        FormError(field_name=field_name, field_title=field_title, errors=error_messages.get(field_name, []))
+        for field_name, field_title in SUBMIT_GAME_FIELD_TITLES.items()
     ]
 
     template_str = catalog.render("ErrorHolderOobCollection", form_errors=form_errors)
@@ -275,47 +312,103 @@ def handle_request_entity_too_large_error(request: Request, exc: HTTPException)
 
 
 # region Utility Functions
+def _name_cache(transaction: AsyncSession) -> dict[tuple[type, str], System | Genre | ContentWarning]:
+    # Scoped to the session so a name looked up or created earlier in the request isn't queried again
+    return transaction.info.setdefault("submit_game_name_cache", {})
+
+
 async def create_if_not_exists[T: System | Genre | ContentWarning](
     model_type: type[T],
     name: str,
     transaction: AsyncSession,
 ) -> T:
-    existing = await transaction.execute(select(model_type).where(model_type.name == name))
-    existing = existing.scalars().one_or_none()
-    if existing is not None:
-        return existing
-    return model_type(name=name)
+    return (await create_many_if_not_exists(model_type, [name], transaction))[name]
+
+
+async def create_many_if_not_exists[T: System | Genre | ContentWarning](
+    model_type: type[T],
+    names: list[str],
+    transaction: AsyncSession,
+) -> dict[str, T]:
+    name_cache = _name_cache(transaction)
+    by_name: dict[str, T] = {}
+    for name in names:
+        if (cached := name_cache.get((model_type, name))) is not None:
+            by_name[name] = cast(T, cached)
+
+    missing_names = [name for name in names if name not in by_name]
+    if missing_names:
+        existing = await transaction.execute(select(model_type).where(model_type.name.in_(missing_names)))
+        by_name.update({row.name: row for row in existing.scalars()})
+        for name in missing_names:
+            if name not in by_name:
+                by_name[name] = model_type(name=name)
+            name_cache[(model_type, name)] = by_name[name]
+    return by_name
+
+
+async def resolve_sqids_or_new[T: Genre | ContentWarning](
+    model_type: type[T],
+    values: list[SqidOrNew[str]],
+    transaction: AsyncSession,
+) -> list[int | T]:
+    # One lookup for all of the new names rather than one query each
+    by_name = await create_many_if_not_exists(
+        model_type, [value.value for value in values if not isinstance(value, int)], transaction
+    )
+    return [value if isinstance(value, int) else by_name[value.value] for value in values]
 
 
-async def create_new_links(
+async def resolve_ids_creating_new[T: Genre | ContentWarning](
+    model_type: type[T],
+    values: list[SqidOrNew[str]],
+    transaction: AsyncSession,
+) -> list[int]:
+    resolved = await resolve_sqids_or_new(model_type, values, transaction)
+    new_models = [value for value in resolved if not isinstance(value, int)]
+    if new_models:
+        transaction.add_all(new_models)
+        await transaction.flush()
+    # Deduplicated, since a repeated ID would break the link table's unique constraint
+    return list(dict.fromkeys(value if isinstance(value, int) else value.id for value in resolved))
+
+
+async def insert_new_links(
     data: SubmitGameForm,
     transaction: AsyncSession,
     game: Game,
-) -> tuple[list[GameGenreLink], list[GameContentWarningLink], list[GameRequirementTimeSlotLink]]:
-    genre_links = [
-        (
-            GameGenreLink(game=game, genre_id=genre)
-            if isinstance(genre, int)
-            else GameGenreLink(game=game, genre=await create_if_not_exists(Genre, genre.value, transaction))
+) -> None:
+    # Inserted in bulk with a single statement per link table, so the game must already be flushed.
+    # Bulk inserts skip the ORM before_insert listeners, so event_id is set here instead.
+    genre_ids = await resolve_ids_creating_new(Genre, data.genre, transaction)
+    content_warning_ids = await resolve_ids_creating_new(ContentWarning, data.content_warning, transaction)
+    time_slot_ids = list(dict.fromkeys(data.available_time_slot))
+
+    if genre_ids:
+        await transaction.execute(
+            insert(GameGenreLink),
+            [{"game_id": game.id, "genre_id": genre_id} for genre_id in genre_ids],
         )
-        for genre in data.genre
-    ]
-    content_warning_links = [
-        (
-            GameContentWarningLink(game=game, content_warning_id=content_warning)
-            if isinstance(content_warning, int)
-            else GameContentWarningLink(
-                game=game,
-                content_warning=await create_if_not_exists(ContentWarning, content_warning.value, transaction),
-            )
+    if content_warning_ids:
+        await transaction.execute(
+            insert(GameContentWarningLink),
+            [
+                {"game_id": game.id, "content_warning_id": content_warning_id}
+                for content_warning_id in content_warning_ids
+            ],
+        )
+    if time_slot_ids:
+        await transaction.execute(
+            insert(GameRequirementTimeSlotLink),
+            [
+                {
+                    "game_requirement_id": game.game_requirement.id,
+                    "time_slot_id": time_slot_id,
+                    "event_id": game.event_id,
+                }
+                for time_slot_id in time_slot_ids
+            ],
         )
-        for content_warning in data.content_warning
-    ]
-    time_slot_links = [
-        GameRequirementTimeSlotLink(game_requirement=game.game_requirement, time_slot_id=time_slot_id)
-        for time_slot_id in data.available_time_slot
-    ]
-    return genre_links, content_warning_links, time_slot_links
 
 
 async def create_image(
@@ -332,17 +425,77 @@ async def create_image_links(
     game: Game,
     image_loader: ImageLoader,
 ) -> list[GameImageLink]:
+    uploads = [(i, image) for i, image in enumerate(data.image) if isinstance(image, UploadFile)]
+    # Uploads don't touch the session, so they can be saved concurrently
+    images = await asyncio.gather(*(create_image(image, image_loader) for _, image in uploads))
     return [
         GameImageLink(
             game=game,
-            image=await create_image(image, image_loader),
+            image=image,
             sort_order=i,
         )
-        for i, image in enumerate(data.image)
-        if isinstance(image, UploadFile)
+        for (i, _), image in zip(uploads, images, strict=True)
     ]
 
 
+async def fetch_existing_link_ids(
+    transaction: AsyncSession,
+    link_type: type[GameGenreLink | GameContentWarningLink | GameRequirementTimeSlotLink],
+    target_id_column: InstrumentedAttribute[int],
+    parent_filter: ColumnExpressionArgument[bool],
+) -> dict[int, int]:
+    # Plain (target id, link id) rows are all the reconciliation needs, so the link objects aren't loaded
+    rows = await transaction.execute(select(target_id_column, link_type.id).where(parent_filter))
+    return dict(rows.tuples().all())
+
+
+async def delete_links_by_id(
+    transaction: AsyncSession,
+    link_type: type[GameGenreLink | GameContentWarningLink | GameRequirementTimeSlotLink | GameImageLink],
+    link_ids: list[int],
+) -> None:
+    # A single DELETE per link table rather than one per removed link
+    if link_ids:
+        await transaction.execute(delete(link_type).where(link_type.id.in_(link_ids)))
+
+
+async def update_game_image_links(
+    transaction: AsyncSession,
+    game: Game,
+    desired_image_ids_or_images: list[int | Image],
+) -> None:
+    """Make the game's image links match the desired images and their order. Needs game.image_links loaded."""
+    kept_image_links: list[GameImageLink] = []
+    removed_image_link_ids: list[int] = []
+    for image_link in game.image_links:
+        if image_link.image_id not in desired_image_ids_or_images:
+            removed_image_link_ids.append(image_link.id)
+        else:
+            # This image link is staying, so just update the sort order
+            image_link.sort_order = desired_image_ids_or_images.index(image_link.image_id)
+            kept_image_links.append(image_link)
+    # The removed links are bulk deleted below, so take them out of the loaded collection without recording a change.
+    # Otherwise flushing the game would try to save them again after the DELETE.
+    set_committed_value(game, "image_links", kept_image_links)
+    await delete_links_by_id(transaction, GameImageLink, removed_image_link_ids)
+
+    existing_image_ids = {link.image_id for link in kept_image_links}
+    # Add any new image links that are not already in the existing list
+    for i, image_id_or_image in enumerate(desired_image_ids_or_images):
+        if isinstance(image_id_or_image, int):
+            # Technically since you won't share the same image ID across multiple games, this is a bit redundant
+            # But maybe in future we will be sharing images across games/systems/etc
+            if image_id_or_image in existing_image_ids:
+                # This image link already exists, so skip it
+                continue
+            image_link = GameImageLink(game_id=game.id, image_id=image_id_or_image, sort_order=i)
+        else:
+            image_link = GameImageLink(game=game, image=image_id_or_image, sort_order=i)
+
+        # Actually add it
+        transaction.add(image_link)
+
+
 def game_with(*options: ExecutableOption):
     async def wrapper(
         transaction: AsyncSession,
@@ -369,7 +522,8 @@ class SubmitGameController(Controller):
     @get(
         path="/event/{event_sqid:str}/submit-game",
         guards=[user_guard],
-        dependencies={"event": event_with(selectinload(Event.time_slots))},
+        # Joined so the event and its time slots arrive in a single round-trip
+        dependencies={"event": event_with(joinedload(Event.time_slots))},
     )
     async def get_submit_game(self, request: Request, event: Event, user: User) -> Template:
         if not event.is_submissions_open() and not user_has_permission(
@@ -382,14 +536,6 @@ class SubmitGameController(Controller):
             block_name=request.htmx.target,
             context={
                 "event": event,
-                "tones": GameTone,
-                "crunches": GameCrunch,
-                "core_activities": GameCoreActivity,
-                "ksps": GameKSP,
-                "table_size_requirements": GameTableSizeRequirement,
-                "equipment_requirements": GameEquipmentRequirement,
-                "activity_requirements": GameActivityRequirement,
-                "room_requirements": GameRoomRequirement,
             },
         )
 
@@ -398,10 +544,10 @@ class SubmitGameController(Controller):
         guards=[user_guard],
         dependencies={
             "game": game_with(
-                selectinload(Game.system),
-                selectinload(Game.gamemaster),
-                selectinload(Game.event).selectinload(Event.time_slots),
-                selectinload(Game.game_requirement).selectinload(GameRequirement.available_time_slots),
+                # Only what the form renders - the permission check reads gamemaster_id, not the gamemaster
+                joinedload(Game.system),
+                joinedload(Game.event).selectinload(Event.time_slots),
+                joinedload(Game.game_requirement).selectinload(GameRequirement.available_time_slots),
                 selectinload(Game.genres),
                 selectinload(Game.content_warnings),
                 selectinload(Game.images),
@@ -433,22 +579,14 @@ class SubmitGameController(Controller):
             context={
                 "event": game.event,
                 "game": game,
-                # TODO: Move these to globals
-                "tones": GameTone,
-                "crunches": GameCrunch,
-                "core_activities": GameCoreActivity,
-                "ksps": GameKSP,
-                "table_size_requirements": GameTableSizeRequirement,
-                "equipment_requirements": GameEquipmentRequirement,
-                "activity_requirements": GameActivityRequirement,
-                "room_requirements": GameRoomRequirement,
             },
         )
 
     @post(
         path="/event/{event_sqid:str}/game",
         guards=[user_guard],
-        dependencies={"event": event_with(selectinload(Event.time_slots))},
+        # Only the event's own columns are needed to check submissions are open, so its time slots aren't loaded
+        dependencies={"event": event_with()},
         exception_handlers={
             ValidationException: handle_submit_game_form_validation_error,
             HTTP_413_REQUEST_ENTITY_TOO_LARGE: handle_request_entity_too_large_error,
@@ -505,12 +643,6 @@ class SubmitGameController(Controller):
             ),
         )
 
-        # Genres, Content Warrnings, Available Time Slots
-        genre_links, content_warning_links, time_slot_links = await create_new_links(
-            data=data,
-            transaction=transaction,
-            game=new_game,
-        )
         image_links = await create_image_links(
             data=data,
             game=new_game,
@@ -518,13 +650,16 @@ class SubmitGameController(Controller):
         )
 
         transaction.add(new_game)
-        transaction.add_all(genre_links)
-        transaction.add_all(content_warning_links)
-        transaction.add_all(time_slot_links)
         transaction.add_all(image_links)
 
         await transaction.flush()
-        await transaction.refresh(new_game)
+
+        # Genres, Content Warnings, Available Time Slots
+        await insert_new_links(
+            data=data,
+            transaction=transaction,
+            game=new_game,
+        )
 
         return HTMXBlockTemplate(
             re_target="#content",
@@ -543,12 +678,9 @@ class SubmitGameController(Controller):
         request_max_body_size=20 * 1024 * 1024,  # 20 MB
         dependencies={
             "game": game_with(
-                selectinload(Game.system),
-                selectinload(Game.gamemaster),
-                selectinload(Game.event).selectinload(Event.time_slots),
-                selectinload(Game.game_requirement).selectinload(GameRequirement.time_slot_links),
-                selectinload(Game.genre_links),
-                selectinload(Game.content_warning_links),
+                # Only what's needed for the permission checks and reconciling the links
+                joinedload(Game.event),
+                joinedload(Game.game_requirement),
                 selectinload(Game.image_links),
             ),
             "permission": permission_check(user_can_edit_game),
@@ -570,54 +702,73 @@ class SubmitGameController(Controller):
         ):
             raise AlertError([Alert("alert-warning", "Game editing is not currently open for this event.")])
 
-        # Update all the properties
-        # This is kept in the same order as the POST method to make it easier to compare
-        game.name = data.title
-        game.tagline = data.tagline
-        game.description = data.description
-        game.classification = data.classification
-        game.crunch = data.crunch
-        game.core_activity = data.core_activity
-        game.tone = data.tone
-        game.player_count_minimum = data.player_count_minimum_prop
-        game.player_count_optimum = data.player_count_optimum_prop
-        game.player_count_maximum = data.player_count_maximum_prop
-        game.ksps = data.ksp
         if isinstance(data.system, int):
-            game.system_id = data.system
+            system_id = data.system
         else:
-            game.system = await create_if_not_exists(System, data.system.value, transaction)
-        # existing_game.gamemaster=request.user  - Not updated!
-        # existing_game.event_id=event_id  - Not updated!
-
-        game.game_requirement.times_to_run = data.times_to_run
-        game.game_requirement.scheduling_notes = data.scheduling_notes
-        game.game_requirement.table_size_requirement = data.table_size_requirement
-        game.game_requirement.table_size_notes = data.table_size_notes
-        game.game_requirement.equipment_requirement = data.equipment_requirement
-        game.game_requirement.equipment_notes = data.equipment_notes
-        game.game_requirement.activity_requirement = data.activity_requirement
-        game.game_requirement.activity_notes = data.activity_notes
-        game.game_requirement.room_requirement = data.room_requirement
-        game.game_requirement.room_notes = data.room_notes
+            system = await create_if_not_exists(System, data.system.value, transaction)
+            transaction.add(system)
+            await transaction.flush()
+            system_id = system.id
+
+        # Update all the properties with a single UPDATE each, which also keeps the loaded objects in sync
+        # This is kept in the same order as the POST method to make it easier to compare
+        await transaction.execute(
+            update(Game)
+            .where(Game.id == game.id)
+            .values(
+                name=data.title,
+                tagline=data.tagline,
+                description=data.description,
+                classification=data.classification,
+                crunch=data.crunch,
+                core_activity=data.core_activity,
+                tone=data.tone,
+                player_count_minimum=data.player_count_minimum_prop,
+                player_count_optimum=data.player_count_optimum_prop,
+                player_count_maximum=data.player_count_maximum_prop,
+                ksps=data.ksp,
+                system_id=system_id,
+                # gamemaster_id - Not updated!
+                # event_id - Not updated!
+            )
+        )
+        await transaction.execute(
+            update(GameRequirement)
+            .where(GameRequirement.id == game.game_requirement.id)
+            .values(
+                times_to_run=data.times_to_run,
+                scheduling_notes=data.scheduling_notes,
+                table_size_requirement=data.table_size_requirement,
+                table_size_notes=data.table_size_notes,
+                equipment_requirement=data.equipment_requirement,
+                equipment_notes=data.equipment_notes,
+                activity_requirement=data.activity_requirement,
+                activity_notes=data.activity_notes,
+                room_requirement=data.room_requirement,
+                room_notes=data.room_notes,
+            )
+        )
 
         # Reassign the links
         # TODO - This is a bit of a hack because we can't just automatically update the game requirement
         # For two reasons:
         # 1. This could be creating new Genres OR using existing ones
         # 2. It's not a true linking table because it's got extra data in it, so some ORM helpers don't work
-        desired_genre_ids_or_new_genres = [
-            genre if isinstance(genre, int) else await create_if_not_exists(Genre, genre.value, transaction)
-            for genre in data.genre
-        ]
+        desired_genre_ids_or_new_genres = await resolve_sqids_or_new(Genre, data.genre, transaction)
+        desired_genre_ids = {genre_id for genre_id in desired_genre_ids_or_new_genres if isinstance(genre_id, int)}
+        existing_genre_ids = await fetch_existing_link_ids(
+            transaction, GameGenreLink, GameGenreLink.genre_id, GameGenreLink.game_id == game.id
+        )
         # Remove any genre links that are not in the desired list
-        for genre_link in game.genre_links:
-            if genre_link.genre_id not in desired_genre_ids_or_new_genres:
-                await transaction.delete(genre_link)
+        await delete_links_by_id(
+            transaction,
+            GameGenreLink,
+            [link_id for genre_id, link_id in existing_genre_ids.items() if genre_id not in desired_genre_ids],
+        )
         # Add any new genre links that are not already in the existing list
         for genre_id_or_new_genre in desired_genre_ids_or_new_genres:
             if isinstance(genre_id_or_new_genre, int):
-                if genre_id_or_new_genre in [link.genre_id for link in game.genre_links]:
+                if genre_id_or_new_genre in existing_genre_ids:
                     # This genre link already exists, so skip it
                     continue
                 genre_link = GameGenreLink(game_id=game.id, genre_id=genre_id_or_new_genre)
@@ -628,22 +779,34 @@ class SubmitGameController(Controller):
             transaction.add(genre_link)
 
         # Do the same logic for content warnings
-        desired_content_warning_ids_or_content_warnings = [
-            content_warning
-            if isinstance(content_warning, int)
-            else await create_if_not_exists(ContentWarning, content_warning.value, transaction)
-            for content_warning in data.content_warning
-        ]
+        desired_content_warning_ids_or_content_warnings = await resolve_sqids_or_new(
+            ContentWarning, data.content_warning, transaction
+        )
+        desired_content_warning_ids = {
+            content_warning_id
+            for content_warning_id in desired_content_warning_ids_or_content_warnings
+            if isinstance(content_warning_id, int)
+        }
+        existing_content_warning_ids = await fetch_existing_link_ids(
+            transaction,
+            GameContentWarningLink,
+            GameContentWarningLink.content_warning_id,
+            GameContentWarningLink.game_id == game.id,
+        )
         # Remove any content warning links that are not in the desired list
-        for content_warning_link in game.content_warning_links:
-            if content_warning_link.content_warning_id not in desired_content_warning_ids_or_content_warnings:
-                await transaction.delete(content_warning_link)
+        await delete_links_by_id(
+            transaction,
+            GameContentWarningLink,
+            [
+                link_id
+                for content_warning_id, link_id in existing_content_warning_ids.items()
+                if content_warning_id not in desired_content_warning_ids
+            ],
+        )
         # Add any new content warning links that are not already in the existing list
         for content_warning_id_or_new_content_warning in desired_content_warning_ids_or_content_warnings:
             if isinstance(content_warning_id_or_new_content_warning, int):
-                if content_warning_id_or_new_content_warning in [
-                    link.content_warning_id for link in game.content_warning_links
-                ]:
+                if content_warning_id_or_new_content_warning in existing_content_warning_ids:
                     # This content warning link already exists, so skip it
                     continue
                 content_warning_link = GameContentWarningLink(
@@ -658,14 +821,26 @@ class SubmitGameController(Controller):
             transaction.add(content_warning_link)
 
         # Time slots
-        desired_time_slot_ids = data.available_time_slot
+        desired_time_slot_ids = set(data.available_time_slot)
+        existing_time_slot_ids = await fetch_existing_link_ids(
+            transaction,
+            GameRequirementTimeSlotLink,
+            GameRequirementTimeSlotLink.time_slot_id,
+            GameRequirementTimeSlotLink.game_requirement_id == game.game_requirement.id,
+        )
         # Remove any time slot links that are not in the desired list
-        for time_slot_link in game.game_requirement.time_slot_links:
-            if time_slot_link.time_slot_id not in desired_time_slot_ids:
-                await transaction.delete(time_slot_link)
+        await delete_links_by_id(
+            transaction,
+            GameRequirementTimeSlotLink,
+            [
+                link_id
+                for time_slot_id, link_id in existing_time_slot_ids.items()
+                if time_slot_id not in desired_time_slot_ids
+            ],
+        )
         # Add any new time slot links that are not already in the existing list
         for time_slot_id in desired_time_slot_ids:
-            if time_slot_id in [link.time_slot_id for link in game.game_requirement.time_slot_links]:
+            if time_slot_id in existing_time_slot_ids:
                 # This time slot link already exists, so skip it
                 continue
             time_slot_link = GameRequirementTimeSlotLink(
@@ -674,32 +849,17 @@ class SubmitGameController(Controller):
             transaction.add(time_slot_link)
 
         # Images
-        desired_image_ids_or_images = [
-            image if isinstance(image, int) else await create_image(image, image_loader) for image in data.image
-        ]
-        # Remove any image links that are not in the desired list
-        for image_link in game.image_links:
-            if image_link.image_id not in desired_image_ids_or_images:
-                await transaction.delete(image_link)
-            else:
-                # This image link is staying, so just update the sort order
-                image_link.sort_order = desired_image_ids_or_images.index(image_link.image_id)
-        # Add any new image links that are not already in the existing list
-        for i, image_id_or_image in enumerate(desired_image_ids_or_images):
-            if isinstance(image_id_or_image, int):
-                # Technically since you won't share the same image ID across multiple games, this is a bit redundant
-                # But maybe in future we will be sharing images across games/systems/etc
-                if image_id_or_image in [link.image_id for link in game.image_links]:
-                    # This image link already exists, so skip it
-                    continue
-                image_link = GameImageLink(game_id=game.id, image_id=image_id_or_image, sort_order=i)
-            else:
-                image_link = GameImageLink(game=game, image=image_id_or_image, sort_order=i)
-
-            # Actually add it
-            transaction.add(image_link)
+        # Uploads don't touch the session, so they can be saved concurrently
+        new_images = iter(
+            await asyncio.gather(
+                *(create_image(image, image_loader) for image in data.image if not isinstance(image, int))
+            )
+        )
+        desired_image_ids_or_images = [image if isinstance(image, int) else next(new_images) for image in data.image]
+        await update_game_image_links(transaction, game, desired_image_ids_or_images)
 
         transaction.add(game)
+        invalidate_event_filter_options(game.event_id)
 
         return HTMXBlockTemplate(
             re_target="#content",
@@ -713,10 +873,10 @@ class SubmitGameController(Controller):
         guards=[user_guard],
         dependencies={
             "game": game_with(
-                selectinload(Game.game_requirement),
-                selectinload(Game.gamemaster),
-                selectinload(Game.event),
-                selectinload(Game.system),
+                joinedload(Game.game_requirement),
+                joinedload(Game.gamemaster),
+                joinedload(Game.event),
+                joinedload(Game.system),
             ),
             "permission": permission_check(user_can_approve_game),
         },
@@ -732,6 +892,7 @@ class SubmitGameController(Controller):
 
         game.submission_status = data.submission_status
         transaction.add(game)
+        invalidate_event_filter_options(game.event_id)
 
         template_str = catalog.render(
             "GameSubmissionRow",
@@ -1,20 +1,62 @@
+import hashlib
+import mimetypes
+from dataclasses import dataclass
 from pathlib import Path
 
-from litestar import Router, get
-from litestar.config.response_cache import CACHE_FOREVER
+import brotli
+from litestar import Response, Router, get
 from litestar.handlers import HTTPRouteHandler
-from litestar.response.file import File
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
 
 from convergence_games.app.paths import STATIC_DIR_PATH
+from convergence_games.app.request_type import Request
+
+
+@dataclass(frozen=True, slots=True)
+class Favicon:
+    content: bytes
+    brotli_content: bytes | None
+    media_type: str
+    etag: str
+
+
+def load_favicon(favicon_path: Path) -> Favicon:
+    content = favicon_path.read_bytes()
+    brotli_content = brotli.compress(content, quality=11)
+    return Favicon(
+        content=content,
+        # The PNGs are already compressed, so only keep a brotli copy when it actually saves something
+        brotli_content=brotli_content if len(brotli_content) < len(content) else None,
+        media_type=mimetypes.guess_type(favicon_path.name)[0] or "application/octet-stream",
+        etag=f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"',
+    )
+
+
+# Favicons only change with a deploy, so browsers can keep them without revalidating
+FAVICON_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 route_handlers: list[HTTPRouteHandler] = []
 
 for favicon_path in (STATIC_DIR_PATH / "favicon").iterdir():
     # We've got to bind favicon_file to the closure to avoid a late binding issue.
     def create_favicon_route(favicon_path: Path = favicon_path) -> HTTPRouteHandler:
-        @get(path=f"/{favicon_path.name}", cache=CACHE_FOREVER, opt={"no_compression": True}, include_in_schema=False)
-        async def favicon_route() -> File:
-            return File(favicon_path)
+        # Read and compressed once here, so requests never touch the disk
+        favicon = load_favicon(favicon_path)
+
+        @get(path=f"/{favicon_path.name}", opt={"no_compression": True}, include_in_schema=False)
+        async def favicon_route(request: Request) -> Response[bytes]:
+            headers = {"etag": favicon.etag, "cache-control": FAVICON_CACHE_CONTROL}
+            if request.headers.get("if-none-match") == favicon.etag:
+                return Response(content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+            if favicon.brotli_content is None:
+                return Response(content=favicon.content, media_type=favicon.media_type, headers=headers)
+
+            headers["vary"] = "accept-encoding"
+            if "br" in request.headers.get("accept-encoding", ""):
+                headers["content-encoding"] = "br"
+                return Response(content=favicon.brotli_content, media_type=favicon.media_type, headers=headers)
+            return Response(content=favicon.content, media_type=favicon.media_type, headers=headers)
 
         return favicon_route
 
@@ -30,6 +30,9 @@ _upper_sqids = Sqids(alphabet="ABCDEFGHIJKLMNOPQRSTUVWXYZ", min_length=SETTINGS.
 
 Sqid = NewType("Sqid", str)
 
+# Encoding and decoding is pure Python and pages swim/sink the same handful of ids hundreds of times per request
+SQID_CACHE_SIZE = 8192
+
 
 @lru_cache
 def _ink(class_name: str) -> int:
@@ -39,6 +42,7 @@ def _ink(class_name: str) -> int:
     return int(sha256(class_name.encode()).hexdigest(), base=16) % 256
 
 
+@lru_cache(maxsize=SQID_CACHE_SIZE)
 def sink(sqid: Sqid) -> int:
     """
     Extract the ID from a sqid.
@@ -47,6 +51,7 @@ def sink(sqid: Sqid) -> int:
     return _sqids.decode(sqid)[-1]
 
 
+@lru_cache(maxsize=SQID_CACHE_SIZE)
 def sink_upper(sqid: Sqid) -> int:
     """
     Extract the ID from an upper-case sqid.
@@ -55,6 +60,16 @@ def sink_upper(sqid: Sqid) -> int:
     return _upper_sqids.decode(sqid)[-1]
 
 
+@lru_cache(maxsize=SQID_CACHE_SIZE)
+def _encode(class_name: str, obj_id: int) -> Sqid:
+    return cast(Sqid, _sqids.encode([_ink(class_name), obj_id]))
+
+
+@lru_cache(maxsize=SQID_CACHE_SIZE)
+def _encode_upper(class_name: str, obj_id: int) -> Sqid:
+    return cast(Sqid, _upper_sqids.encode([_ink(class_name), obj_id]))
+
+
 @overload
 def swim(obj: HasID) -> Sqid: ...
 
@@ -75,7 +90,7 @@ def swim(obj: HasID | str, obj_id: int | None = None) -> Sqid:
         class_name = obj.__class__.__name__
         obj_id = cast(int, obj.id)
 
-    return cast(Sqid, _sqids.encode([_ink(class_name), obj_id]))
+    return _encode(class_name, obj_id)
 
 
 @overload
@@ -98,7 +113,7 @@ def swim_upper(obj: HasID | str, obj_id: int | None = None) -> Sqid:
         class_name = obj.__class__.__name__
         obj_id = cast(int, obj.id)
 
-    return cast(Sqid, _upper_sqids.encode([_ink(class_name), obj_id]))
+    return _encode_upper(class_name, obj_id)
 
 
 if __name__ == "__main__":
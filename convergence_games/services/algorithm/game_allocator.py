@@ -523,7 +523,7 @@ class GameAllocator:
             self.print(f"Compensation Total = {compensation.total}")
             if best_compensation is None or compensation < best_compensation:
                 self.print("Better result :white_check_mark:")
-                print(f"Found better result at {i} - {compensation.real_total} (total {compensation.total})")
+                self.print(f"Found better result at {i} - {compensation.real_total} (total {compensation.total})")
                 best_results = results
                 best_compensation = compensation
             self.print("")
@@ -286,10 +286,6 @@ async def adapt_results_to_database(
     alg_results: list[AlgResult],
     compensation: Compensation,
 ) -> None:
-    print(time_slot_id)
-    print(alg_results)
-    print(compensation)
-
     _ = await transaction.execute(delete(Allocation).where(Allocation.session.has(time_slot_id=time_slot_id)))
 
     new_allocations: list[Allocation] = []
@@ -60,6 +60,8 @@ class Settings(BaseSettings):
     DATABASE_NAME: str = ""
     DATABASE_ECHO: bool = False
     DATABASE_POOL_RECYCLE: int = 300
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
 
     @property
     def DATABASE_URL(self) -> URL:  # noqa: N802
@@ -0,0 +1,22 @@
+"""Shared fixtures for the frontend router tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from convergence_games.db.models import Base
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncGenerator[AsyncSession]:
+    """An empty in-memory database. Test modules override this fixture to seed the rows they need."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as s:
+        yield s
+    await engine.dispose()
@@ -0,0 +1,104 @@
+"""Tests for search_with_fuzzy_match."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from convergence_games.app.routers.frontend.search import (
+    get_search_choices,
+    get_selected_name,
+    invalidate_search_choices,
+    search_with_fuzzy_match,
+)
+from convergence_games.db.enums import SubmissionStatus
+from convergence_games.db.models import Genre, System, SystemAlias
+
+
+@pytest_asyncio.fixture
+async def session(session: AsyncSession) -> AsyncGenerator[AsyncSession]:
+    session.add_all(
+        [
+            Genre(name=name, submission_status=SubmissionStatus.APPROVED)
+            for name in ["Fable", "Fantasy", "Farce", "Horror", "Sci-Fi"]
+        ]
+    )
+    system = System(name="Dungeons & Dragons 5e", submission_status=SubmissionStatus.APPROVED)
+    session.add(system)
+    await session.flush()
+    session.add(SystemAlias(name="DnD", system_id=system.id))
+    await session.flush()
+    yield session
+    for model_type in (Genre, System):
+        invalidate_search_choices(model_type)
+
+
+@pytest.mark.asyncio
+async def test_short_search_uses_prefix_matches_only(session: AsyncSession) -> None:
+    results = await search_with_fuzzy_match(session, Genre, "fa")
+    assert [r.name for r in results] == ["Fable", "Fantasy", "Farce"]
+    assert all(r.score == 100 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_prefix_search_escapes_wildcards(session: AsyncSession) -> None:
+    results = await search_with_fuzzy_match(session, Genre, "%")
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_longer_search_falls_through_to_fuzzy(session: AsyncSession) -> None:
+    results = await search_with_fuzzy_match(session, Genre, "Fnatasy")
+    assert [r.name for r in results] == ["Fantasy"]
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_matches_system_aliases(session: AsyncSession) -> None:
+    results = await search_with_fuzzy_match(session, System, "dnd")
+    assert results[0].name == "Dungeons & Dragons 5e"
+    assert results[0].match == "DnD"
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_choices_are_cached_until_invalidated(session: AsyncSession) -> None:
+    assert [r.name for r in await search_with_fuzzy_match(session, Genre, "Horrro")] == ["Horror"]
+
+    session.add(Genre(name="Horrror", submission_status=SubmissionStatus.APPROVED))
+    await session.flush()
+    assert [r.name for r in await search_with_fuzzy_match(session, Genre, "Horrro")] == ["Horror"]
+
+    invalidate_search_choices(Genre)
+    assert "Horrror" in [r.name for r in await search_with_fuzzy_match(session, Genre, "Horrro")]
+
+
+@pytest.mark.asyncio
+async def test_selected_name_uses_cached_choices(session: AsyncSession) -> None:
+    choices = await get_search_choices(session, System)
+    system_id = choices.owner_ids[0]
+    assert choices.names_by_id == {system_id: "Dungeons & Dragons 5e"}
+
+    # Served from the cache, so a rename isn't seen until the choices are invalidated
+    system = await session.get(System, system_id)
+    assert system is not None
+    system.name = "D&D"
+    assert await get_selected_name(session, System, system_id) == "Dungeons & Dragons 5e"
+
+    invalidate_search_choices(System)
+    assert await get_selected_name(session, System, system_id) == "D&D"
+    assert await get_selected_name(session, System, system_id + 1) is None
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_includes_only_your_own_unapproved_entries(session: AsyncSession) -> None:
+    session.add(Genre(name="Horrorcore", submission_status=SubmissionStatus.SUBMITTED, created_by=1))
+    await session.flush()
+
+    assert "Horrorcore" in [r.name for r in await search_with_fuzzy_match(session, Genre, "Horrorcor", user_id=1)]
+    assert "Horrorcore" not in [r.name for r in await search_with_fuzzy_match(session, Genre, "Horrorcor", user_id=2)]
+    assert "Horrorcore" not in [r.name for r in await search_with_fuzzy_match(session, Genre, "Horrorcor")]
+
+    # Only the approved choices are cached, and they are shared between every user
+    assert "Horrorcore" not in (await get_search_choices(session, Genre)).match_names
@@ -0,0 +1,122 @@
+"""Tests for the submit game form validators."""
+
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from typing import Annotated
+
+import pytest
+import pytest_asyncio
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from convergence_games.app.routers.frontend.submit_game import (
+    IntFlagValidator,
+    NewValue,
+    create_if_not_exists,
+    make_sqid_or_new_validator,
+    resolve_sqids_or_new,
+    update_game_image_links,
+)
+from convergence_games.db.enums import GameKSP
+from convergence_games.db.models import Event, Game, GameImageLink, Genre, Image, System, User
+
+ksp_adapter: TypeAdapter[GameKSP] = TypeAdapter(Annotated[GameKSP, IntFlagValidator])
+
+
+@pytest_asyncio.fixture
+async def session(session: AsyncSession) -> AsyncSession:
+    session.add(Genre(name="Horror"))
+    await session.flush()
+    return session
+
+
+def test_int_flag_validator_combines_list_values() -> None:
+    assert ksp_adapter.validate_python(["1", "4"]) == GameKSP.DESIGNER_RUN | GameKSP.IN_PLAYTEST
+
+
+def test_int_flag_validator_ignores_repeated_flags() -> None:
+    assert ksp_adapter.validate_python(["2", "2"]) == GameKSP.NZ_MADE
+
+
+def test_int_flag_validator_accepts_single_value() -> None:
+    assert ksp_adapter.validate_python("8") == GameKSP.FOR_SALE
+
+
+def test_sqid_or_new_validator_is_shared_per_type() -> None:
+    assert make_sqid_or_new_validator(str) is make_sqid_or_new_validator(str)
+
+
+def test_sqid_or_new_validator_parses_new_values() -> None:
+    assert make_sqid_or_new_validator(str)("new:Solarpunk") == NewValue(value="Solarpunk")
+
+
+@pytest.mark.asyncio
+async def test_resolve_sqids_or_new_reuses_existing_and_repeated_names(session: AsyncSession) -> None:
+    resolved = await resolve_sqids_or_new(
+        Genre,
+        [7, NewValue(value="Horror"), NewValue(value="Solarpunk"), NewValue(value="Solarpunk")],
+        session,
+    )
+
+    assert resolved[0] == 7
+    assert isinstance(resolved[1], Genre) and resolved[1].id is not None
+    assert isinstance(resolved[2], Genre) and resolved[2].id is None
+    assert resolved[2] is resolved[3]
+
+
+@pytest.mark.asyncio
+async def test_create_if_not_exists_reuses_names_within_a_session(session: AsyncSession) -> None:
+    first = await create_if_not_exists(Genre, "Solarpunk", session)
+    second = await create_if_not_exists(Genre, "Solarpunk", session)
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_update_game_image_links_removes_and_reorders_images(session: AsyncSession) -> None:
+    now = dt.datetime.now(tz=dt.timezone.utc)
+    event = Event(name="Convergence", start_date=now, end_date=now)
+    system = System(name="Mothership")
+    gamemaster = User(first_name="Game", last_name="Master")
+    images = [Image(lookup_key=uuid.uuid4()) for _ in range(3)]
+    session.add_all([event, system, gamemaster, *images])
+    await session.flush()
+    game = Game(
+        name="Dead Planet",
+        tagline="",
+        description="",
+        player_count_minimum=2,
+        player_count_optimum=4,
+        player_count_maximum=5,
+        system_id=system.id,
+        gamemaster_id=gamemaster.id,
+        event_id=event.id,
+    )
+    session.add(game)
+    await session.flush()
+    # SQLite can't generate ids for the link table's composite primary key
+    session.add_all(
+        [GameImageLink(id=i + 1, game_id=game.id, image_id=image.id, sort_order=i) for i, image in enumerate(images)]
+    )
+    await session.flush()
+    session.expunge_all()
+
+    # Load the game the same way put_game does, then drop the middle image and swap the other two
+    game = (
+        await session.execute(select(Game).options(selectinload(Game.image_links)).where(Game.id == game.id))
+    ).scalar_one()
+    await update_game_image_links(session, game, [images[2].id, images[0].id])
+    session.add(game)
+    await session.flush()
+
+    links = (
+        await session.execute(
+            select(GameImageLink.image_id, GameImageLink.sort_order).order_by(GameImageLink.sort_order)
+        )
+    ).all()
+    assert [tuple(link) for link in links] == [(images[2].id, 0), (images[0].id, 1)]
+    assert {link.image_id for link in game.image_links} == {images[0].id, images[2].id}